@@ -1,26 +1,94 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+# Schemas nested deeper than this are converted to type strings without
+# recursion, to stay clear of the interpreter's recursion limit.
+_MAX_RECURSIVE_SCHEMA_DEPTH = 100
+
+# Mapping from json schema primitive types to the python type names we print.
+_TYPE_NAMES = {
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "string": "str",
+    "null": "None",
+}
+
+
+# Hosts that are considered local when deciding whether a url is a local url.
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "0.0.0.0", "::1"})
+
+# Url prefixes that are cheap to recognize without a full urlparse.
+_FAST_URL_PREFIXES = ("http://", "https://", "ftp://", "s3://")
+
+
+def _fast_netloc(candidate_str: str) -> Optional[str]:
+    """
+    Returns the netloc of the given string if it starts with one of the common
+    url prefixes in `_FAST_URL_PREFIXES`, or None otherwise, in which case the
+    caller should fall back to urlparse.
+    """
+    if not candidate_str.startswith(_FAST_URL_PREFIXES):
+        return None
+    netloc = candidate_str[candidate_str.index("//") + 2 :]
+    for delimiter in "/?#":
+        netloc = netloc.partition(delimiter)[0]
+    # Leave anything that urlparse treats specially to urlparse itself: ipv6
+    # brackets (which it validates), the "\t\r\n" characters (which it strips)
+    # and non-ascii characters (which it checks for normalization).
+    if (
+        not netloc.isascii()
+        or "[" in netloc
+        or "]" in netloc
+        or "\t" in netloc
+        or "\r" in netloc
+        or "\n" in netloc
+    ):
+        return None
+    return netloc
+
 
 def _is_valid_url(candidate_str: str) -> bool:
+    netloc = _fast_netloc(candidate_str)
+    if netloc is not None:
+        return netloc != ""
     parsed = urlparse(candidate_str)
     return parsed.scheme != "" and parsed.netloc != ""
 
 
 def _is_local_url(candidate_str: str) -> bool:
-    parsed = urlparse(candidate_str)
-    local_hosts = ["localhost", "127.0.0.1", "0.0.0.0", "::1"]
-    return parsed.hostname in local_hosts
+    netloc = _fast_netloc(candidate_str)
+    if netloc is None:
+        return urlparse(candidate_str).hostname in _LOCAL_HOSTS
+    host = netloc.rpartition("@")[2].partition(":")[0]
+    return host.lower() in _LOCAL_HOSTS
 
 
-def _json_to_type_string(schema: Dict) -> str:
+def _schema_children(schema: Dict) -> List[Dict]:
     """
-    Internal util function to convert a json to a type string.
+    Returns the sub-schemas whose type strings are needed to build the type
+    string of the given schema, in the order they are printed.
+    """
+    if "type" in schema:
+        if "items" in schema:
+            return [schema["items"]]
+        elif "prefixItems" in schema:
+            return schema["prefixItems"]
+        return []
+    elif "anyOf" in schema:
+        return schema["anyOf"]
+    return []
+
+
+def _assemble_type_string(schema: Dict, children: List[str]) -> str:
+    """
+    Builds the type string of a schema, given the already converted type strings
+    of its children (as returned by `_schema_children`).
     """
     if "type" in schema:
         if "items" in schema:
             # items defines the type of items in an array.
-            typestr = f"{schema['type']}[{_json_to_type_string(schema['items'])}]"
+            typestr = f"{schema['type']}[{children[0]}]"
         elif "prefixItems" in schema:
             # repeateditems defines the type of the first few items in an array, and
             # then the min and max of the array.
@@ -29,33 +97,71 @@ def _json_to_type_string(schema: Dict) -> str:
             min_items = schema.get("minItems", "?")
             max_items = schema.get("maxItems", "?")
             if min_items == max_items and min_items != "?":
-                typestr = (
-                    f"{schema['type']}[{', '.join(_json_to_type_string(x) for x in schema['prefixItems'])}]"
-                )
+                typestr = f"{schema['type']}[{', '.join(children)}]"
             else:
                 typestr = (
-                    f"{schema['type']}[{', '.join(_json_to_type_string(x) for x in schema['prefixItems'])},"
-                    f" ...] (min={min_items},max={max_items})"
+                    f"{schema['type']}[{', '.join(children)}, ...]"
+                    f" (min={min_items},max={max_items})"
                 )
         else:
-            typestr = {
-                "integer": "int",
-                "number": "float",
-                "boolean": "bool",
-                "string": "str",
-                "null": "None",
-            }.get(schema["type"], schema["type"])
-
+            typestr = f"{_TYPE_NAMES.get(schema['type'], schema['type'])}"
     elif "anyOf" in schema:
-        typestr = f"({' | '.join(_json_to_type_string(x) for x in schema['anyOf'])})"
+        typestr = f"({' | '.join(children)})"
     else:
-        # If we have no idea waht the type is, we will just return "Any".
+        # If we have no idea what the type is, we will just return "Any".
         typestr = "Any"
     if "default" in schema:
-        typestr += f" (default: {schema['default']})"
+        typestr = f"{typestr} (default: {schema['default']})"
     return typestr
 
 
+def _json_to_type_string(schema: Dict, _depth: int = 0) -> str:
+    """
+    Internal util function to convert a json to a type string.
+    """
+    if _depth >= _MAX_RECURSIVE_SCHEMA_DEPTH:
+        # Pathologically deep schema: continue without recursion, so that we do
+        # not hit the recursion limit.
+        return _json_to_type_string_iterative(schema)
+    if len(schema) == 1:
+        # Fast path for the very common plain leaves such as {"type": "string"}.
+        typ = schema.get("type")
+        if isinstance(typ, str) and typ in _TYPE_NAMES:
+            return _TYPE_NAMES[typ]
+    children = _schema_children(schema)
+    if children:
+        children = [_json_to_type_string(x, _depth + 1) for x in children]
+    return _assemble_type_string(schema, children)
+
+
+def _json_to_type_string_iterative(schema: Dict) -> str:
+    """
+    Same as `_json_to_type_string`, but walks the schema with an explicit stack
+    instead of recursion.
+    """
+    # Post-order walk. A stack entry holds the node and, once the node has been
+    # expanded, its children. Children are pushed in reverse so that they finish
+    # in order, leaving their type strings at the tail of `results`.
+    stack: List[Tuple[Dict, Optional[List[Dict]]]] = [(schema, None)]
+    results: List[str] = []
+    while stack:
+        node, children = stack.pop()
+        if children is None:
+            children = _schema_children(node)
+            stack.append((node, children))
+            for child in reversed(children):
+                stack.append((child, None))
+            continue
+        num_children = len(children)
+        if num_children:
+            child_strings = results[-num_children:]
+            del results[-num_children:]
+        else:
+            child_strings = []
+        results.append(_assemble_type_string(node, child_strings))
+    return results[0]
+
+
 def _get_api_info(openapi: Dict, path_name: str) -> Tuple[Dict, bool]:
     """
     Get the api information of the given path from the openapi specification.
@@ -76,6 +182,17 @@ def _get_api_info(openapi: Dict, path_name: str) -> Tuple[Dict, bool]:
     return (api_info, is_post)
 
 
+def _resolve_ref(components: Dict, ref: Optional[str]) -> Optional[Dict]:
+    """
+    Resolve a "$ref" string such as "#/components/schemas/Foo" against the
+    components/schemas section of the openapi specification. Returns None if the
+    ref is None or cannot be resolved.
+    """
+    if ref is None:
+        return None
+    return components.get(ref.rsplit("/", 1)[-1])
+
+
 def _get_post_input_schema(openapi: Dict, api_info: Dict) -> Dict:
     """
     Get the input schema from the api info.
@@ -85,9 +202,18 @@ def _get_post_input_schema(openapi: Dict, api_info: Dict) -> Dict:
     schema_ref = api_info["requestBody"]["content"]["application/json"]["schema"][
         "$ref"
     ]
-    schema_name = schema_ref.split("/")[-1]
-    schema = openapi["components"]["schemas"][schema_name]
-    return schema
+    return openapi["components"]["schemas"][schema_ref.rsplit("/", 1)[-1]]
+
+
+def _compile_docstrings(openapi: Dict) -> Dict[str, str]:
+    """
+    Get the docstrings of all paths in the openapi specification, as a mapping
+    from path name to docstring.
+    """
+    return {
+        path_name: _get_method_docstring(openapi, path_name)
+        for path_name in openapi.get("paths", {})
+    }
 
 
 def _get_method_docstring(openapi: Dict, path_name: str) -> str:
@@ -106,63 +232,68 @@ def _get_method_docstring(openapi: Dict, path_name: str) -> str:
         # TODO: add support to parse get methods' parameters.
         return docstring
 
-    docstring += "\n\nAutomatically inferred parameters from openapi:"
-    # Add schema to the docstring.
-    try:
-        schema = _get_post_input_schema(openapi, api_info)
+    # Walk the openapi specification only once, collecting the input schema, the
+    # example and the output schema together.
+    components = openapi.get("components", {}).get("schemas", {})
+    content = (
+        api_info.get("requestBody", {}).get("content", {}).get("application/json", {})
+    )
+    input_schema = _resolve_ref(components, content.get("schema", {}).get("$ref"))
+    example = content.get("example")
+    output_schema = _resolve_ref(
+        components,
+        api_info.get("responses", {})
+        .get("200", {})
+        .get("content", {})
+        .get("application/json", {})
+        .get("schema", {})
+        .get("$ref"),
+    )
+
+    parts = [docstring, "\n\nAutomatically inferred parameters from openapi:"]
+    # Add schema to the docstring. If the openapi does not have a schema section,
+    # we will just skip.
+    if input_schema is not None and "properties" in input_schema:
         schema_strings = [
-            (k, _json_to_type_string(v)) for k, v in schema["properties"].items()
+            (k, _json_to_type_string(v)) for k, v in input_schema["properties"].items()
         ]
         if len(schema_strings) == 0:
-            docstring += "\n\nInput Schema: None"
-        elif "required" in schema:
+            parts.append("\n\nInput Schema: None")
+        elif "required" in input_schema:
+            # A set makes the membership checks below O(1) instead of a list scan.
+            required = set(input_schema["required"])
             # We will sort the schema strings to make required fields appear first
             schema_strings = sorted(
-                schema_strings, key=lambda x: x[0] in schema["required"], reverse=True
+                schema_strings, key=lambda x: x[0] in required, reverse=True
             )
-            docstring += "\n\nInput Schema (*=required):\n  " + "\n  ".join(
-                [
-                    f"{k}{'*' if k in schema['required'] else ''}: {v}"
+            parts.append("\n\nInput Schema (*=required):\n  ")
+            parts.append(
+                "\n  ".join([
+                    f"{k}{'*' if k in required else ''}: {v}"
                     for k, v in schema_strings
-                ]
+                ])
             )
         else:
-            docstring += "\n\nSchema:\n  " + "\n  ".join(
-                [f"{k}: {v}" for k, v in schema_strings]
-            )
-    except KeyError:
-        # If the openapi does not have a schema section, we will just skip.
-        pass
+            parts.append("\n\nSchema:\n  ")
+            parts.append("\n  ".join([f"{k}: {v}" for k, v in schema_strings]))
 
     # Add example input to the docstring if existing.
-    try:
-        example = api_info["requestBody"]["content"]["application/json"]["example"]
-        example_string = "\n  ".join(
-            [str(k) + ": " + str(v) for k, v in example.items()]
-        )
-        docstring += f"\n\nExample input:\n  {example_string}\n"
-    except KeyError:
-        # If the openapi does not have an example section, we will just skip.
-        pass
+    if example is not None:
+        parts.append("\n\nExample input:\n  ")
+        parts.append("\n  ".join([f"{k}: {v}" for k, v in example.items()]))
+        parts.append("\n")
 
     # Add output schema to the docstring.
-    try:
-        schema_ref = api_info["responses"]["200"]["content"]["application/json"][
-            "schema"
-        ]["$ref"]
-        schema_name = schema_ref.split("/")[-1]
-        schema = openapi["components"]["schemas"][schema_name]
-        schema_strings = [
-            (k, _json_to_type_string(v)) for k, v in schema["properties"].items()
-        ]
-        docstring += "\n\nOutput Schema:\n  " + "\n  ".join(
-            [f"{k}: {v}" for k, v in schema_strings]
+    if output_schema is not None and "properties" in output_schema:
+        parts.append("\n\nOutput Schema:\n  ")
+        parts.append(
+            "\n  ".join([
+                f"{k}: {_json_to_type_string(v)}"
+                for k, v in output_schema["properties"].items()
+            ])
         )
-    except KeyError:
-        # If the openapi does not have a schema section, we will just skip.
-        pass
 
-    return docstring
+    return "".join(parts)
 
 
 def _get_positional_argument_error_message(
@@ -172,36 +303,33 @@ def _get_positional_argument_error_message(
         "Photon methods do not support positional arguments. If your client is named"
         f" `c`, Use `help(c.{path_name[1:]})` to see the function signature."
     )
-    if openapi:
-        try:
-            additional_message = ""
-            api_info, is_post = _get_api_info(openapi, path_name)
-            if is_post:
-                schema = _get_post_input_schema(openapi, api_info)
-                if len(args) <= len(schema["properties"]):
-                    additional_message += (
-                        "\n\nIt seems that you have passed in positional arguments for"
-                        f" the path `{path_name}`:\n    {args}\nDid you mean the"
-                        f" following?\n    {path_name[1:]}(\n"
-                    )
-                    # Note: this actually assumes that the schema['properties'] is ordered, which luckily seems to be
-                    # the case for now.
-                    for i in range(len(args)):
-                        additional_message += (
-                            "       "
-                            f" {list(schema['properties'].keys())[i]}={repr(args[i])},\n"
-                        )
-                    additional_message += "    )\n"
-                    additional_message += (
-                        "(while we try to be helpful, this is just a guess, and may not"
-                        " be correct)"
-                    )
-        except KeyError:
-            # Fallback option: if the best-effort guess of the proper calling format
-            # fails, we will just use the default message.
-            additional_message = ""
-        POSITIONAL_ARGUMENT_ERROR_MESSAGE += additional_message
-    return POSITIONAL_ARGUMENT_ERROR_MESSAGE
+    if not openapi:
+        return POSITIONAL_ARGUMENT_ERROR_MESSAGE
+    parts = [POSITIONAL_ARGUMENT_ERROR_MESSAGE]
+    try:
+        api_info, is_post = _get_api_info(openapi, path_name)
+        if is_post:
+            schema = _get_post_input_schema(openapi, api_info)
+            # Note: this actually assumes that the schema['properties'] is ordered, which luckily seems to be
+            # the case for now.
+            keys = tuple(schema["properties"])
+            if len(args) <= len(keys):
+                parts.append(
+                    "\n\nIt seems that you have passed in positional arguments for"
+                    f" the path `{path_name}`:\n    {args}\nDid you mean the"
+                    f" following?\n    {path_name[1:]}(\n"
+                )
+                for key, arg in zip(keys, args):
+                    parts.append(f"        {key}={arg!r},\n")
+                parts.append(
+                    "    )\n(while we try to be helpful, this is just a guess, and may"
+                    " not be correct)"
+                )
+    except KeyError:
+        # Fallback option: if the best-effort guess of the proper calling format
+        # fails, we will just use the default message.
+        return POSITIONAL_ARGUMENT_ERROR_MESSAGE
+    return "".join(parts)
 
 
 _fallback_api_call_message = (
@@ -0,0 +1,169 @@
+import os
+import tempfile
+
+# Set cache dir to a temp dir before importing anything from leptonai
+tmpdir = tempfile.mkdtemp()
+os.environ["LEPTON_CACHE_DIR"] = tmpdir
+
+import copy
+import unittest
+
+from leptonai._internal.client_utils import (
+    _compile_docstrings,
+    _get_method_docstring,
+    _get_positional_argument_error_message,
+    _is_local_url,
+    _is_valid_url,
+    _json_to_type_string,
+)
+
+
+_OPENAPI = {
+    "paths": {
+        "/run": {
+            "post": {
+                "summary": "Run",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/RunIn"},
+                            "example": {"query": "hello"},
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/RunOut"}
+                            }
+                        }
+                    }
+                },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "RunIn": {
+                "properties": {
+                    "query": {"type": "string"},
+                    "n": {"type": "integer", "default": 3},
+                },
+                "required": ["query"],
+            },
+            "RunOut": {"properties": {"output": {"type": "string"}}},
+        }
+    },
+}
+
+
+class TestClientUtils(unittest.TestCase):
+    def test_url_checks(self):
+        for url in ["http://a.com", "https://localhost:8080/run", "ftp://x", "s3://b"]:
+            self.assertTrue(_is_valid_url(url), url)
+        for url in ["workspace", "http://", "http:///run", "a:b"]:
+            self.assertFalse(_is_valid_url(url), url)
+        for url in [
+            "http://localhost",
+            "https://127.0.0.1:8080/run",
+            "http://[::1]:8080",
+            "http://user@0.0.0.0/",
+            "HTTP://LOCALHOST",
+        ]:
+            self.assertTrue(_is_local_url(url), url)
+        for url in ["https://example.com/localhost", "http://localhost.com", "ws"]:
+            self.assertFalse(_is_local_url(url), url)
+        # Malformed urls behave exactly as with urlparse.
+        self.assertFalse(_is_valid_url("http://\n"))
+        self.assertTrue(_is_local_url("http://local\nhost"))
+        with self.assertRaises(ValueError):
+            _is_valid_url("http://[::1")
+
+    def test_json_to_type_string(self):
+        self.assertEqual(_json_to_type_string({"type": "string"}), "str")
+        self.assertEqual(
+            _json_to_type_string({"type": "array", "items": {"type": "integer"}}),
+            "array[int]",
+        )
+        self.assertEqual(
+            _json_to_type_string(
+                {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None}
+            ),
+            "(str | None) (default: None)",
+        )
+        self.assertEqual(_json_to_type_string({}), "Any")
+        self.assertEqual(
+            _json_to_type_string({
+                "type": "array",
+                "prefixItems": [{"type": "string"}, {"type": "number"}],
+                "minItems": 2,
+            }),
+            "array[str, float, ...] (min=2,max=?)",
+        )
+
+    def test_json_to_type_string_default_formatting(self):
+        # Defaults are printed as they are, without any normalization.
+        self.assertEqual(
+            _json_to_type_string({"type": "object", "default": {"b": 1, "a": 2}}),
+            "object (default: {'b': 1, 'a': 2})",
+        )
+        self.assertEqual(
+            _json_to_type_string({"type": "array", "default": ("x",)}),
+            "array (default: ('x',))",
+        )
+
+    def test_json_to_type_string_deeply_nested(self):
+        depth = 5000
+        schema = {"type": "string"}
+        for _ in range(depth):
+            schema = {"type": "array", "items": schema}
+        self.assertEqual(
+            _json_to_type_string(schema), "array[" * depth + "str" + "]" * depth
+        )
+
+    def test_json_to_type_string_deeply_nested_mixed(self):
+        # Exercises anyOf, prefixItems and defaults beyond the recursion cutoff.
+        depth = 300
+        schema = {"type": "integer", "default": 0}
+        expected = "int (default: 0)"
+        for i in range(depth):
+            if i % 2:
+                schema = {"anyOf": [schema, {"type": "null"}], "default": None}
+                expected = f"({expected} | None) (default: None)"
+            else:
+                schema = {
+                    "type": "array",
+                    "prefixItems": [{"type": "string"}, schema],
+                    "minItems": 2,
+                }
+                expected = f"array[str, {expected}, ...] (min=2,max=?)"
+        self.assertEqual(_json_to_type_string(schema), expected)
+
+    def test_method_docstring(self):
+        docstring = _get_method_docstring(_OPENAPI, "/run")
+        self.assertIn("Run", docstring)
+        self.assertIn("query*: str", docstring)
+        self.assertIn("n: int (default: 3)", docstring)
+        self.assertIn("Example input:\n  query: hello", docstring)
+        self.assertIn("Output Schema:\n  output: str", docstring)
+
+    def test_compile_docstrings(self):
+        docstrings = _compile_docstrings(copy.deepcopy(_OPENAPI))
+        self.assertEqual(list(docstrings), ["/run"])
+        self.assertEqual(docstrings["/run"], _get_method_docstring(_OPENAPI, "/run"))
+
+    def test_positional_argument_error_message(self):
+        message = _get_positional_argument_error_message(_OPENAPI, "/run", ("a", 1))
+        self.assertIn(
+            "Did you mean the following?\n    run(\n        query='a',\n       "
+            " n=1,\n    )",
+            message,
+        )
+        # Too many positional arguments: no guess is made.
+        message = _get_positional_argument_error_message(_OPENAPI, "/run", (1, 2, 3))
+        self.assertNotIn("Did you mean", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
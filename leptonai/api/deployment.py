@@ -1,9 +1,28 @@
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Union, Optional
+from urllib3.util.retry import Retry
 import warnings
 
 from .util import create_header, json_or_error, APIError
 
+# (connect, read) timeout in seconds for deployment api calls, so that an
+# unresponsive server does not block the caller forever. Read timeouts are not
+# retried (see `read=0` below), so a hung server fails after about 30 seconds.
+_TIMEOUT = (5, 30)
+
+# A module level session so that repeated calls (e.g. listing and then polling
+# deployments) reuse pooled keep-alive connections instead of doing a new TCP and
+# TLS handshake every time.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, read=0, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
 
 def list_deployment(url: str, auth_token: Optional[str]) -> Union[List, APIError]:
     """
@@ -11,7 +30,9 @@ def list_deployment(url: str, auth_token: Optional[str]) -> Union[List, APIError
 
     Returns a list of deployments.
     """
-    response = requests.get(url + "/deployments", headers=create_header(auth_token))
+    response = _SESSION.get(
+        url + "/deployments", headers=create_header(auth_token), timeout=_TIMEOUT
+    )
     # sanity check that the response is actually a list or APIError
     content = json_or_error(response)
     if isinstance(content, dict):
@@ -25,8 +46,10 @@ def remove_deployment(url: str, auth_token: Optional[str], name: str):
 
     Returns 200 if successful, 404 if the deployment does not exist.
     """
-    response = requests.delete(
-        url + "/deployments/" + name, headers=create_header(auth_token)
+    response = _SESSION.delete(
+        url + "/deployments/" + name,
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     return response
 
@@ -35,8 +58,10 @@ def get_deployment(url: str, auth_token: Optional[str], name: str):
     """
     Get a deployment from a workspace.
     """
-    response = requests.get(
-        url + "/deployments/" + name, headers=create_header(auth_token)
+    response = _SESSION.get(
+        url + "/deployments/" + name,
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     return json_or_error(response)
 
@@ -48,8 +73,10 @@ def get_readiness(url: str, auth_token: Optional[str], name: str):
     Returns the deployment info if successful, and APIError if the deployment
     does not exist.
     """
-    response = requests.get(
-        url + "/deployments/" + name + "/readiness", headers=create_header(auth_token)
+    response = _SESSION.get(
+        url + "/deployments/" + name + "/readiness",
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     return json_or_error(response)
 
@@ -60,8 +87,10 @@ def get_termination(url: str, auth_token: Optional[str], name: str):
 
     Returns the deployment's information about earlier terminations, if exist.
     """
-    response = requests.get(
-        url + "/deployments/" + name + "/termination", headers=create_header(auth_token)
+    response = _SESSION.get(
+        url + "/deployments/" + name + "/termination",
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     return json_or_error(response)
 
@@ -73,8 +102,10 @@ def get_replicas(url: str, auth_token: Optional[str], name: str):
     Returns the deployment info if successful, and APIError if the deployment
     does not exist.
     """
-    response = requests.get(
-        url + "/deployments/" + name + "/replicas", headers=create_header(auth_token)
+    response = _SESSION.get(
+        url + "/deployments/" + name + "/replicas",
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     return json_or_error(response)
 
@@ -86,10 +117,13 @@ def get_log(url: str, auth_token: Optional[str], name: str, replica: str):
     Returns the deployment info if successful, and APIError if the deployment
     does not exist.
     """
-    response = requests.get(
+    # Note: only a connect timeout here, as the log stream may stay idle for
+    # longer than any reasonable read timeout.
+    response = _SESSION.get(
         url + "/deployments/" + name + "/replicas/" + replica + "/log",
         headers=create_header(auth_token),
         stream=True,  # stream the response
+        timeout=(_TIMEOUT[0], None),
     )
     if response.ok:
         for chunk in response.iter_content(chunk_size=None):
@@ -134,10 +168,11 @@ def update_deployment(
         warnings.warn(
             "There is nothing to update - did you forget to pass in any arguments?"
         )
-    response = requests.patch(
+    response = _SESSION.patch(
         url + "/deployments/" + name,
         headers=create_header(auth_token),
         json=deployment_body,
+        timeout=_TIMEOUT,
     )
     return json_or_error(response)
 
@@ -150,14 +185,16 @@ def get_qps(url: str, auth_token: Optional[str], name: str, by_path: bool = Fals
     does not exist.
     """
     if by_path:
-        response = requests.get(
+        response = _SESSION.get(
             url + "/deployments/" + name + "/monitoring/FastAPIQPSByPath",
             headers=create_header(auth_token),
+            timeout=_TIMEOUT,
         )
     else:
-        response = requests.get(
+        response = _SESSION.get(
             url + "/deployments/" + name + "/monitoring/FastAPIQPS",
             headers=create_header(auth_token),
+            timeout=_TIMEOUT,
         )
     return json_or_error(response)
 
@@ -170,13 +207,15 @@ def get_latency(url: str, auth_token: Optional[str], name: str, by_path: bool =
     does not exist.
     """
     if by_path:
-        response = requests.get(
+        response = _SESSION.get(
             url + "/deployments/" + name + "/monitoring/FastAPILatencyByPath",
             headers=create_header(auth_token),
+            timeout=_TIMEOUT,
         )
     else:
-        response = requests.get(
+        response = _SESSION.get(
             url + "/deployments/" + name + "/monitoring/FastAPILatency",
             headers=create_header(auth_token),
+            timeout=_TIMEOUT,
         )
     return json_or_error(response)
@@ -136,17 +136,22 @@ def fetch(url: str, auth_token: Optional[str], id: str, path: str):
     else:
         need_rename = False
 
+    # (connect, read) timeout: the read timeout applies to each chunk, so large
+    # photons still download fine, but a hanging server cannot block forever.
     response = requests.get(
         url + "/photons/" + id + "?content=true",
         stream=True,
         headers=create_header(auth_token),
+        timeout=(5, 30),
     )
 
     if response.status_code > 299:
         return APIError(response)
 
+    # Stream the photon to disk instead of materializing it in memory first.
     with open(path, "wb") as f:
-        f.write(response.content)
+        for chunk in response.iter_content(chunk_size=65536):
+            f.write(chunk)
 
     photon = load(path)
 
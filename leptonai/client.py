@@ -8,7 +8,7 @@ import requests
 from leptonai._internal.client_utils import (
     _is_valid_url,
     _is_local_url,
-    _get_method_docstring,
+    _compile_docstrings,
     _get_positional_argument_error_message,
     _fallback_api_call_message,
 )
@@ -149,6 +149,11 @@ class Client(object):
                 RuntimeWarning,
             )
 
+        # Docstrings of all paths are generated once, when the client is created.
+        self._docstrings = (
+            _compile_docstrings(self.openapi) if isinstance(self.openapi, dict) else {}
+        )
+
         # At load time, we will also set up all path caches.
         for path_name in self.paths():
             function_name = path_name[1:] if path_name.startswith("/") else path_name
@@ -218,7 +223,7 @@ class Client(object):
 
             _method.__name__ = function_name
             if self.openapi:
-                _method.__doc__ = _get_method_docstring(self.openapi, path_name)
+                _method.__doc__ = self._docstrings.get(path_name, "")
             self._path_cache[function_name] = _method
         return self._path_cache[function_name]
 
@@ -249,7 +254,7 @@ class Client(object):
 
             _method.__name__ = function_name
             if self.openapi:
-                _method.__doc__ = _get_method_docstring(self.openapi, path_name)
+                _method.__doc__ = self._docstrings.get(path_name, "")
             else:
                 _method.__doc__ = ""
             self._path_cache[function_name] = _method
@@ -46,7 +46,6 @@ LEPTON_WORKSPACE_URL = LEPTON_DASHBOARD_URL + "/workspace/{workspace_id}"
 # Append "/demo", "/api", "/metrics", "/events", "/replicas/list" for the deployment dashboard functions.
 LEPTON_DEPLOYMENT_URL = LEPTON_WORKSPACE_URL + "/deployments/detail/{deployment_name}"
 
-if pydantic.version.VERSION < "2.0.0":
-    PYDANTIC_MAJOR_VERSION = 1
-else:
-    PYDANTIC_MAJOR_VERSION = 2
+# Note: compare the major version numerically, as a string comparison would be
+# wrong for e.g. "10.0.0".
+PYDANTIC_MAJOR_VERSION = 1 if int(pydantic.version.VERSION.split(".")[0]) < 2 else 2
@@ -1,5 +1,4 @@
-import requests
-
+from leptonai.api.deployment import _SESSION, _TIMEOUT
 from leptonai.util import create_header, check_and_print_http_error
 
 
@@ -7,7 +6,9 @@ def list_deployment(url: str, auth_token: str):
     """
     List all deployments on a workspace.
     """
-    response = requests.get(url + "/deployments", headers=create_header(auth_token))
+    response = _SESSION.get(
+        url + "/deployments", headers=create_header(auth_token), timeout=_TIMEOUT
+    )
     if check_and_print_http_error(response):
         return None
     return response.json()
@@ -17,8 +18,10 @@ def remove_deployment(url: str, auth_token: str, name: str):
     """
     Remove a deployment from a workspace.
     """
-    response = requests.delete(
-        url + "/deployments/" + name, headers=create_header(auth_token)
+    response = _SESSION.delete(
+        url + "/deployments/" + name,
+        headers=create_header(auth_token),
+        timeout=_TIMEOUT,
     )
     if check_and_print_http_error(response):
         return None
@@ -143,16 +143,21 @@ def fetch(id: str, url: str, path: str, auth_token: str):
         path = CACHE_DIR / f"tmp.{id}.photon"
         need_rename = True
 
+    # (connect, read) timeout: the read timeout applies to each chunk, so large
+    # photons still download fine, but a hanging server cannot block forever.
     response = requests.get(
         url + "/photons/" + id + "?content=true",
         stream=True,
         headers=create_header(auth_token),
+        timeout=(5, 30),
     )
     if check_and_print_http_error(response):
         sys.exit(1)
 
+    # Stream the photon to disk instead of materializing it in memory first.
     with open(path, "wb") as f:
-        f.write(response.content)
+        for chunk in response.iter_content(chunk_size=65536):
+            f.write(chunk)
 
     photon = load(path)
 
@@ -1,6 +1,5 @@
 from io import BytesIO
 import os
-import tempfile
 from typing import List, Union, Optional, Dict, Any
 
 from backports.cached_property import cached_property
@@ -397,11 +396,9 @@ class HuggingfaceASRPhoton(HuggingfacePhoton):
     )
     def run_handler(self, inputs: Union[str, FileParam]) -> str:
         if isinstance(inputs, FileParam):
-            file = tempfile.NamedTemporaryFile()
-            with open(file.name, "wb") as f:
-                f.write(inputs.file.read())
-                f.flush()
-            inputs = file.name
+            # The pipeline decodes raw audio bytes directly, so there is no need
+            # to round-trip the upload through a temporary file.
+            inputs = inputs.content
 
         res = self.run(inputs)
         return res["text"]
@@ -602,19 +599,11 @@ class HuggingfaceAudioClassificationPhoton(HuggingfacePhoton):
         inputs_is_list = isinstance(inputs, list)
         if not inputs_is_list:
             inputs = [inputs]
-        inputs_ = []
-        # keep references to NamedTemporaryFile objects so they don't get deleted
-        temp_files = []
-        for inp in inputs:
-            if isinstance(inp, FileParam):
-                file = tempfile.NamedTemporaryFile()
-                with open(file.name, "wb") as f:
-                    f.write(inp.file.read())
-                    f.flush()
-                temp_files.append(file)
-                inputs_.append(file.name)
-            else:
-                inputs_.append(inp)
+        # The pipeline decodes raw audio bytes directly, so uploaded files are
+        # passed in memory instead of through temporary files.
+        inputs_ = [
+            inp.content if isinstance(inp, FileParam) else inp for inp in inputs
+        ]
         res = self.run(
             inputs_,
             **kwargs,
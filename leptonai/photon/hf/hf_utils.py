@@ -1,15 +1,55 @@
+import functools
+
 from loguru import logger
 
 from leptonai.registry import Registry
 
 pipeline_registry = Registry()
 
+# Lazily imported heavy modules, so that importing this module (and the
+# registry) stays cheap and the pipeline creators do not go through the import
+# system on every call.
+_torch = None
+_diffusers = None
+
+
+def _get_torch():
+    global _torch
+    if _torch is None:
+        import torch
+
+        _torch = torch
+    return _torch
+
+
+def _get_diffusers():
+    global _diffusers
+    if _diffusers is None:
+        import diffusers
+
+        _diffusers = diffusers
+    return _diffusers
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    # torch.cuda.is_available() does device discovery on every call, and the
+    # answer does not change during the lifetime of the process.
+    return _get_torch().cuda.is_available()
+
+
+# TODO: dolly model needs it. however we need to check if it's
+# safe to enable it for all models
+_TRANSFORMERS_BASE_KWARGS = {"trust_remote_code": True}
+
 
 def create_diffusion_pipeline(task, model, revision, torch_compile=False):
-    from diffusers import DiffusionPipeline, DPMSolverMultistepScheduler
-    import torch
+    diffusers = _get_diffusers()
+    DiffusionPipeline = diffusers.DiffusionPipeline
+    DPMSolverMultistepScheduler = diffusers.DPMSolverMultistepScheduler
+    torch = _get_torch()
 
-    if torch.cuda.is_available():
+    if _cuda_available():
         torch_dtype = torch.float16
     else:
         torch_dtype = torch.bfloat16
@@ -31,7 +71,7 @@ def create_diffusion_pipeline(task, model, revision, torch_compile=False):
     pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
         pipeline.scheduler.config
     )
-    if torch.cuda.is_available():
+    if _cuda_available():
         pipeline = pipeline.to("cuda")
         if torch_compile:
             try:
@@ -59,17 +99,16 @@ pipeline_registry.register(
 
 def create_transformers_pipeline(task, model, revision):
     from transformers import pipeline
-    import torch
 
-    # TODO: dolly model needs it. however we need to check if it's
-    # safe to enable it for all models
-    kwargs = {"trust_remote_code": True}
-    if torch.cuda.is_available():
+    torch = _get_torch()
+
+    kwargs = dict(_TRANSFORMERS_BASE_KWARGS)
+    if _cuda_available():
         kwargs["device"] = 0
 
     # audio-classification pipeline doesn't support automatically
     # converting inputs from fp32 to fp16
-    if torch.cuda.is_available() and task != "audio-classification":
+    if _cuda_available() and task != "audio-classification":
         torch_dtype = torch.float16
     else:
         # TODO: check if bfloat16 is well supported
@@ -89,27 +128,25 @@ def create_transformers_pipeline(task, model, revision):
     return pipeline
 
 
-for task in [
-    "audio-classification",
-    "automatic-speech-recognition",
-    "sentiment-analysis",
-    "summarization",
-    "text-classification",
-    "text-generation",
-    "text2text-generation",
-]:
-    pipeline_registry.register(
-        task,
-        create_transformers_pipeline,
+pipeline_registry.register_many({
+    task: create_transformers_pipeline
+    for task in (
+        "audio-classification",
+        "automatic-speech-recognition",
+        "sentiment-analysis",
+        "summarization",
+        "text-classification",
+        "text-generation",
+        "text2text-generation",
     )
+})
 
 
 def create_sentence_transformers_pipeline(task, model, revision):
     from sentence_transformers import SentenceTransformer
-    import torch
 
     kwargs = {}
-    if torch.cuda.is_available():
+    if _cuda_available():
         kwargs["device"] = 0
 
     st_model = SentenceTransformer(model, **kwargs)
@@ -117,3 +154,6 @@ def create_sentence_transformers_pipeline(task, model, revision):
 
 
 pipeline_registry.register("sentence-similarity", create_sentence_transformers_pipeline)
+
+# All pipelines are registered above: make the registry read-only.
+pipeline_registry.seal()
@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, Collection, Mapping, Optional, Tuple
 
 from loguru import logger
 
@@ -6,33 +7,71 @@ from loguru import logger
 class Registry:
     """
     A utility class to register and retrieve values by keys.
+
+    Once all values are registered, the registry can be sealed with `seal()`,
+    after which it becomes read-only.
     """
 
     def __init__(self):
         self._map = {}
+        # Tuple of all keys, only set once the registry is sealed.
+        self._keys: Optional[Tuple] = None
 
     def register(self, keys: Any, value: Any):
-        try:
-            _ = iter(keys)
-        except TypeError:
-            is_iterable = False
-        else:
-            is_iterable = True
-
-        if isinstance(keys, str) or not is_iterable:
-            keys = [keys]
+        if self._keys is not None:
+            raise RuntimeError(
+                f"Cannot register {keys} to a sealed registry. All registrations"
+                " should happen before the registry is sealed."
+            )
+        m = self._map
+        if isinstance(keys, (str, bytes)) or not isinstance(keys, Iterable):
+            # A single key, which is the common case.
+            if keys in m:
+                logger.warning(
+                    f'Overriding previously registered "{keys}" value "{value}"'
+                )
+            m[keys] = value
+            return
 
         for key in keys:
-            if key in self._map:
+            if key in m:
                 logger.warning(
                     f'Overriding previously registered "{key}" value "{value}"'
                 )
-            self._map[key] = value
+            m[key] = value
+
+    def register_many(self, mapping: Mapping[Any, Any]):
+        """
+        Registers all key-value pairs in the mapping at once.
+        """
+        if self._keys is not None:
+            raise RuntimeError(
+                f"Cannot register {list(mapping)} to a sealed registry. All"
+                " registrations should happen before the registry is sealed."
+            )
+        for key in mapping.keys() & self._map.keys():
+            logger.warning(
+                f'Overriding previously registered "{key}" value "{mapping[key]}"'
+            )
+        self._map.update(mapping)
+
+    def seal(self):
+        """
+        Makes the registry read-only. Subsequent calls to `register` and
+        `register_many` will raise a RuntimeError.
+        """
+        # Note: reads keep going through the plain dict, which is the fastest
+        # lookup; the key tuple alone marks the registry as sealed.
+        self._keys = tuple(self._map)
 
     def get(self, key: Any) -> Any:
-        if key in self._map:
-            return self._map[key]
-        return None
+        return self._map.get(key)
 
-    def get_all(self):
+    def get_all(self) -> Collection:
+        """
+        Returns all registered keys. Before the registry is sealed this is a
+        live view of the registry, so there is no need to call it repeatedly.
+        """
+        if self._keys is not None:
+            return self._keys
         return self._map.keys()
@@ -0,0 +1,51 @@
+import unittest
+
+from leptonai.registry import Registry
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+class TestRegistry(unittest.TestCase):
+    def test_register_and_get(self):
+        registry = Registry()
+        registry.register("a", 1)
+        registry.register(["b", "c"], 2)
+        registry.register(_is_even, 3)
+        self.assertEqual(registry.get("a"), 1)
+        self.assertEqual(registry.get("b"), 2)
+        self.assertEqual(registry.get("c"), 2)
+        self.assertEqual(registry.get(_is_even), 3)
+        self.assertIsNone(registry.get("d"))
+        self.assertEqual(set(registry.get_all()), {"a", "b", "c", _is_even})
+
+    def test_override(self):
+        registry = Registry()
+        registry.register("a", 1)
+        registry.register("a", 2)
+        self.assertEqual(registry.get("a"), 2)
+
+    def test_register_many(self):
+        registry = Registry()
+        registry.register("a", 1)
+        registry.register_many({"a": 2, "b": 3})
+        self.assertEqual(registry.get("a"), 2)
+        self.assertEqual(registry.get("b"), 3)
+        registry.seal()
+        with self.assertRaises(RuntimeError):
+            registry.register_many({"c": 4})
+
+    def test_seal(self):
+        registry = Registry()
+        registry.register(["a", "b"], 1)
+        registry.seal()
+        self.assertEqual(registry.get("a"), 1)
+        self.assertIsNone(registry.get("c"))
+        self.assertEqual(registry.get_all(), ("a", "b"))
+        with self.assertRaises(RuntimeError):
+            registry.register("c", 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
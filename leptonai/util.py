@@ -10,13 +10,16 @@ from leptonai import config
 
 console = Console(highlight=False)
 
+# copied from
+# https://github.com/leptonai/lepton/blob/732311f395476b67295a730b0be4d104ed7f5bef/api-server/util/util.go#L26
+_PHOTON_NAME_RE = re.compile(r"^[a-z]([-a-z0-9]*[a-z0-9])?$")
+
 
 def create_cached_dir_if_needed():
     """
     Creates the local cached dir if it doesn't exist.
     """
-    if not config.CACHE_DIR.exists():
-        config.CACHE_DIR.mkdir(parents=True)
+    config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @contextmanager
@@ -37,10 +40,7 @@ def check_photon_name(name):
             f"Invalid Photon name '{name}': Name must be less than 32 characters"
         )
 
-    # copied from
-    # https://github.com/leptonai/lepton/blob/732311f395476b67295a730b0be4d104ed7f5bef/api-server/util/util.go#L26
-    name_regex = r"^[a-z]([-a-z0-9]*[a-z0-9])?$"
-    if not re.match(name_regex, name):
+    if not _PHOTON_NAME_RE.match(name):
         raise ValueError(
             f"Invalid Photon name '{name}': Name must consist of lower case"
             " alphanumeric characters or '-', and must start with an alphabetical"